@@ -12,100 +12,146 @@ Author: <Your Name>
 Date: YYYY-MM-DD
 """
 
+import json
 import os
 import re
 import sqlite3
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Iterable, Iterator, List, Optional
 
 import pandas as pd  # make sure pandas is installed
 
+try:
+    import pyarrow  # noqa: F401  (optional: Arrow-backed DataFrame columns)
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# read_sql only accepts dtype_backend from pandas 2.0 on
+ARROW_READ_SQL = HAS_PYARROW and int(pd.__version__.split('.')[0]) >= 2
+
 # ---------------------------
 # Parsing utilities
 # ---------------------------
 
-TUNE_BLOCK_REGEX = re.compile(r'(?m)^(X:.*?)(?=(?:\nX:)|\Z)', re.DOTALL)
-
-
 def find_abc_files(base_dir: str) -> List[str]:
     """
     Recursively find all .abc files in base_dir.
     """
     abc_files = []
-    for root, _, files in os.walk(base_dir):
-        for f in files:
-            if f.lower().endswith('.abc'):
-                abc_files.append(os.path.join(root, f))
+
+    def scan(dir_path: str):
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            # Unreadable directory: skip it, as os.walk does
+            return
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    scan(entry.path)
+                elif entry.is_file() and entry.name.lower().endswith('.abc'):
+                    abc_files.append(entry.path)
+
+    scan(base_dir)
     return sorted(abc_files)
 
 
+@lru_cache(maxsize=None)
+def _book_for_dir(dir_path: str, base_dir: str) -> Optional[int]:
+    """Book number for a directory under base_dir (cached per directory)."""
+    rel = os.path.relpath(dir_path, base_dir)
+    # top-level subfolder is first element ('.' for base_dir itself)
+    parent = rel.split(os.sep)[0]
+    if parent.isdigit():
+        return int(parent)
+    return None
+
+
 def get_book_number_from_path(file_path: str, base_dir: str) -> Optional[int]:
     """
     Derive the book number from the subfolder of base_dir.
     Example: base_dir/2/tune200.abc -> returns 2
     """
-    rel = os.path.relpath(file_path, base_dir)
-    parts = rel.split(os.sep)
-    if len(parts) >= 2:
-        # parent folder is first element
-        parent = parts[0]
-        if parent.isdigit():
-            return int(parent)
-    return None
+    return _book_for_dir(os.path.dirname(file_path), base_dir)
+
+
+# Header field lines for the tags we extract, matched across a whole tune
+# block in one pass so the body's music lines never reach Python code.
+# Anchoring on a literal newline (rather than ^ with re.MULTILINE) lets the
+# regex engine skip ahead between lines. The leading X: line of a block is
+# read by parse_tune_block itself.
+HEADER_FIELD_REGEX = re.compile(r'\n([XTCRMLKxtcrmlk]):([^\n]*)')
+
+# Order of the values in a parsed tune tuple (matches the tunes INSERT columns).
+TUNE_FIELDS = ('x_number', 'title', 'composer', 'rhythm', 'meter', 'unit_length', 'key', 'tune_text')
 
+# Single-valued header tags and their position in a parsed tune tuple
+# (T: is handled separately since a tune may have several titles).
+_TAG_INDEX = {
+    'X': 0,
+    'C': 2,
+    'R': 3,
+    'M': 4,
+    'L': 5,
+    'K': 6,
+}
 
-def parse_tune_block(block: str) -> Dict[str, Any]:
+
+def split_tune_blocks(lines: Iterable[str]) -> Iterator[List[str]]:
     """
-    Parse a single tune block (starting with X:) and extract fields.
-    Returns a dictionary with keys: x_number, titles (list), composer, rhythm, meter, unit_length, key, tune_text.
+    Group lines into tune blocks in a single pass.
+    Each block starts at a line beginning with X: and runs up to the next one;
+    anything before the first X: (file header) is skipped.
     """
-    lines = block.strip().splitlines()
-    fields = {
-        'x_number': None,
-        'titles': [],
-        'composer': None,
-        'rhythm': None,
-        'meter': None,
-        'unit_length': None,
-        'key': None,
-        'tune_text': block.strip()
-    }
+    block = None
     for line in lines:
-        if len(line) >= 2 and line[1] == ':':
-            tag = line[0].upper()
-            value = line[2:].strip()
-            if tag == 'X':
-                fields['x_number'] = value
-            elif tag == 'T':
-                fields['titles'].append(value)
-            elif tag == 'C':
-                fields['composer'] = value
-            elif tag == 'R':
-                fields['rhythm'] = value
-            elif tag == 'M':
-                fields['meter'] = value
-            elif tag == 'L':
-                fields['unit_length'] = value
-            elif tag == 'K':
-                fields['key'] = value
-            # Add handling for other tags if needed
+        if line.startswith('X:'):
+            if block is not None:
+                yield block
+            block = [line]
+        elif block is not None:
+            block.append(line)
+    if block is not None:
+        yield block
+
+
+def parse_tune_block(lines: List[str]) -> tuple:
+    """
+    Parse a single tune block (lines starting with X:) and extract fields.
+    Returns a tuple ordered as TUNE_FIELDS; multiple T: lines are joined into
+    one title. Use dict(zip(TUNE_FIELDS, tune)) where a dict is needed.
+    """
+    tune_text = ''.join(lines).strip()
+    # A block always opens on its X: line, so it is read directly and the
+    # regex only scans from the first newline on (no '\n' + text copy).
+    fields = [lines[0][2:].strip(), None, None, None, None, None, None, tune_text]
+    titles = []
+    tag_index = _TAG_INDEX
+    for tag, value in HEADER_FIELD_REGEX.findall(tune_text):
+        index = tag_index.get(tag.upper())
+        if index is not None:
+            fields[index] = value.strip()
+        else:
+            titles.append(value.strip())
+    # Add other tags to HEADER_FIELD_REGEX and _TAG_INDEX if needed
     # Normalize title to a single string (join multiple T: lines)
-    fields['title'] = ' / '.join(fields['titles']) if fields['titles'] else None
-    return fields
+    if titles:
+        fields[1] = ' / '.join(titles)
+    return tuple(fields)
 
 
-def parse_abc_file(file_path: str) -> List[Dict[str, Any]]:
+def parse_abc_file(file_path: str) -> Iterator[tuple]:
     """
-    Parse all tunes from a given .abc file and return a list of tune dicts.
+    Parse all tunes from a given .abc file, yielding one tune tuple at a time.
+    The file is read line by line so only the current tune block is held in memory.
     """
     with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        content = f.read()
-    blocks = TUNE_BLOCK_REGEX.findall(content)
-    tunes = []
-    for block in blocks:
-        tune = parse_tune_block(block)
-        tunes.append(tune)
-    return tunes
+        for block in split_tune_blocks(f):
+            yield parse_tune_block(block)
 
 
 # ---------------------------
@@ -127,6 +173,45 @@ CREATE TABLE IF NOT EXISTS tunes (
     tune_text TEXT,
     date_added TEXT
 );
+CREATE INDEX IF NOT EXISTS idx_book ON tunes(book);
+CREATE INDEX IF NOT EXISTS idx_composer ON tunes(composer);
+CREATE INDEX IF NOT EXISTS idx_rhythm ON tunes(rhythm);
+"""
+
+# Full-text index over tunes, kept in sync by the triggers below
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS tunes_fts USING fts5(
+    title, composer, tune_text, content='tunes', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS tunes_fts_ai AFTER INSERT ON tunes BEGIN
+    INSERT INTO tunes_fts(rowid, title, composer, tune_text)
+    VALUES (new.id, new.title, new.composer, new.tune_text);
+END;
+CREATE TRIGGER IF NOT EXISTS tunes_fts_ad AFTER DELETE ON tunes BEGIN
+    INSERT INTO tunes_fts(tunes_fts, rowid, title, composer, tune_text)
+    VALUES ('delete', old.id, old.title, old.composer, old.tune_text);
+END;
+CREATE TRIGGER IF NOT EXISTS tunes_fts_au AFTER UPDATE ON tunes BEGIN
+    INSERT INTO tunes_fts(tunes_fts, rowid, title, composer, tune_text)
+    VALUES ('delete', old.id, old.title, old.composer, old.tune_text);
+    INSERT INTO tunes_fts(rowid, title, composer, tune_text)
+    VALUES (new.id, new.title, new.composer, new.tune_text);
+END;
+"""
+
+# Connection tuning for an import-and-analyze workload:
+# - WAL lets readers run alongside the import writer, and synchronous=NORMAL
+#   skips the fsync on every commit. A power loss may drop the last
+#   committed transactions, but the DB file cannot be corrupted; re-running
+#   the import recovers them.
+# - temp tables/indices are kept in memory, the page cache is ~64 MiB, and
+#   a locked DB is retried for up to 5 s instead of failing immediately.
+DB_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-65536;
+PRAGMA busy_timeout=5000;
 """
 
 
@@ -135,57 +220,147 @@ def init_db(db_path: str) -> sqlite3.Connection:
     Initialize SQLite database and return connection.
     """
     conn = sqlite3.connect(db_path)
-    conn.execute(DB_SCHEMA)
-    conn.commit()
+    conn.executescript(DB_PRAGMAS)
+    conn.executescript(DB_SCHEMA)
+    ensure_fts(conn)
     return conn
 
 
-def insert_tune(conn: sqlite3.Connection, tune: Dict[str, Any], book: Optional[int], file_path: str):
+def ensure_fts(conn: sqlite3.Connection):
     """
-    Insert a parsed tune dict into the tunes table.
+    Create tunes_fts and its sync triggers if they are missing, indexing any
+    rows already in tunes (e.g. a DB created before the FTS index existed).
     """
-    now = datetime.utcnow().isoformat()
-    conn.execute(
-        """
-        INSERT INTO tunes (book, file_path, x_number, title, composer, rhythm, meter, unit_length, key, tune_text, date_added)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            book,
-            file_path,
-            tune.get('x_number'),
-            tune.get('title'),
-            tune.get('composer'),
-            tune.get('rhythm'),
-            tune.get('meter'),
-            tune.get('unit_length'),
-            tune.get('key'),
-            tune.get('tune_text'),
-            now
-        )
-    )
+    has_fts = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tunes_fts'"
+    ).fetchone()
+    if has_fts:
+        return
+    conn.executescript(FTS_SCHEMA)
+    conn.execute("INSERT INTO tunes_fts(tunes_fts) VALUES ('rebuild')")
     conn.commit()
 
 
+INSERT_TUNE_COLUMNS = ('book', 'file_path') + TUNE_FIELDS
+
+# date_added is computed by SQLite in every VALUES row (no per-row Python
+# work), which works for any existing tunes table. Stamps are UTC with
+# millisecond precision and a trailing Z, e.g. 2024-01-31T12:00:00.123Z;
+# rows imported by older versions hold datetime.isoformat() stamps
+# (microseconds, no Z), so a DB may mix both formats.
+DATE_ADDED_SQL = "strftime('%Y-%m-%dT%H:%M:%fZ', 'now')"
+
+# Rows per multi-row INSERT, keeping the bound parameters within SQLite's
+# historical SQLITE_MAX_VARIABLE_NUMBER default of 999.
+INSERT_BATCH_ROWS = 999 // len(INSERT_TUNE_COLUMNS)
+
+
+@lru_cache(maxsize=None)
+def insert_tunes_sql(n_rows: int) -> str:
+    """
+    INSERT statement for n_rows tunes in a single VALUES list (cached by n_rows).
+    """
+    row = '(' + ', '.join(['?'] * len(INSERT_TUNE_COLUMNS) + [DATE_ADDED_SQL]) + ')'
+    columns = ', '.join(INSERT_TUNE_COLUMNS + ('date_added',))
+    return f"INSERT INTO tunes ({columns}) VALUES " + ', '.join([row] * n_rows)
+
+
+INSERT_TUNE_SQL = insert_tunes_sql(1)
+
+
+def insert_tune(conn: sqlite3.Connection, tune: tuple, book: Optional[int], file_path: str):
+    """
+    Insert a parsed tune tuple (see parse_tune_block) into the tunes table.
+    Does not commit; committing is the caller's responsibility.
+    """
+    conn.execute(INSERT_TUNE_SQL, (book, file_path) + tune)
+
+
+def insert_tunes(conn: sqlite3.Connection, rows: Iterable[tuple]) -> int:
+    """
+    Insert rows (ordered as INSERT_TUNE_COLUMNS) in multi-row INSERT batches
+    of up to INSERT_BATCH_ROWS. Does not commit.
+    Returns the number of rows inserted.
+    """
+    rows = iter(rows)
+    total = 0
+    while True:
+        batch = list(islice(rows, INSERT_BATCH_ROWS))
+        if not batch:
+            return total
+        conn.execute(insert_tunes_sql(len(batch)), tuple(chain.from_iterable(batch)))
+        total += len(batch)
+
+
 # ---------------------------
 # High-level Import routine
 # ---------------------------
 
-def import_abc_books(base_dir: str, db_path: str) -> int:
+# Parsing is a small share of import time, so a process pool only pays off
+# for large trees; below this many files parsing stays in-process.
+PARALLEL_MIN_FILES = 256
+
+
+def iter_file_rows(file_path: str, base_dir: str) -> Iterator[tuple]:
+    """
+    Parse one .abc file lazily into INSERT parameter tuples.
+    """
+    prefix = (get_book_number_from_path(file_path, base_dir), file_path)
+    for tune in parse_abc_file(file_path):
+        yield prefix + tune
+
+
+def parse_file_rows(file_path: str, base_dir: str) -> List[tuple]:
+    """
+    Parse one .abc file into INSERT parameter tuples.
+    Runs in worker processes, so it returns a (picklable) list.
+    """
+    return list(iter_file_rows(file_path, base_dir))
+
+
+def iter_tune_rows(abc_files: List[str], base_dir: str, max_workers: Optional[int] = None) -> Iterator[tuple]:
+    """
+    Yield INSERT parameter tuples for abc_files in file order.
+    Trees of at least PARALLEL_MIN_FILES files are parsed in a process pool of
+    max_workers (None: one per CPU); only about two files per worker are in
+    flight, so parsed rows cannot pile up ahead of the DB writer. Smaller
+    trees, or max_workers=1, are parsed in the current process, streaming one
+    tune at a time.
+    """
+    if max_workers == 1 or len(abc_files) < PARALLEL_MIN_FILES:
+        for fpath in abc_files:
+            yield from iter_file_rows(fpath, base_dir)
+        return
+    workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for fpath in abc_files:
+            pending.append(executor.submit(parse_file_rows, fpath, base_dir))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def import_abc_books(base_dir: str, db_path: str, max_workers: Optional[int] = None) -> int:
     """
     Walk base_dir, parse .abc files and insert tunes into the DB.
+    Files are parsed as described in iter_tune_rows while this process stays
+    the only DB writer, inserting in multi-row batches (see insert_tunes) in a
+    single transaction.
     Returns total number of tunes inserted.
     """
     conn = init_db(db_path)
     abc_files = find_abc_files(base_dir)
-    total = 0
-    for fpath in abc_files:
-        book = get_book_number_from_path(fpath, base_dir)
-        tunes = parse_abc_file(fpath)
-        for tune in tunes:
-            insert_tune(conn, tune, book, fpath)
-            total += 1
-    conn.close()
+    try:
+        conn.execute("BEGIN")
+        total = insert_tunes(conn, iter_tune_rows(abc_files, base_dir, max_workers))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
     return total
 
 
@@ -193,16 +368,54 @@ def import_abc_books(base_dir: str, db_path: str) -> int:
 # Pandas loading & analysis
 # ---------------------------
 
-def load_tunes_df(db_path: str) -> pd.DataFrame:
+# Low-cardinality columns stored as pandas categoricals (integer codes plus a
+# small table of distinct values) instead of one Python str per row.
+CATEGORY_COLUMNS = ('rhythm', 'key', 'meter', 'composer', 'book')
+
+
+# Columns loaded by default: everything except the (large) raw tune_text.
+DEFAULT_DF_COLUMNS = (
+    'id', 'book', 'file_path', 'x_number', 'title', 'composer',
+    'rhythm', 'meter', 'unit_length', 'key', 'date_added'
+)
+LOADABLE_DF_COLUMNS = DEFAULT_DF_COLUMNS + ('tune_text',)
+
+
+def load_tunes_df(db_path: str, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
     """
-    Load the entire tunes table into a pandas DataFrame.
+    Load the tunes table into a pandas DataFrame.
+    Only `columns` are read (default DEFAULT_DF_COLUMNS); include 'tune_text'
+    explicitly when the raw ABC is needed. Rows come back in id order.
+    Raises ValueError if columns is empty, repeats a name or names anything
+    outside LOADABLE_DF_COLUMNS.
+    With pyarrow installed and pandas >= 2.0, columns are read straight into
+    Arrow buffers (no Python object per cell). Loaded columns in
+    CATEGORY_COLUMNS are converted to the 'category' dtype.
     """
+    columns = list(DEFAULT_DF_COLUMNS if columns is None else columns)
+    if not columns:
+        raise ValueError("columns must name at least one column")
+    unknown = [col for col in columns if col not in LOADABLE_DF_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown tunes column(s): {', '.join(map(str, unknown))}")
+    if len(set(columns)) != len(columns):
+        raise ValueError("columns must not repeat a column")
+    read_kwargs = {'dtype_backend': 'pyarrow'} if ARROW_READ_SQL else {}
     conn = sqlite3.connect(db_path)
-    df = pd.read_sql("SELECT * FROM tunes", conn)
+    df = pd.read_sql(f"SELECT {', '.join(columns)} FROM tunes ORDER BY id", conn, **read_kwargs)
     conn.close()
+    for col in CATEGORY_COLUMNS:
+        if col in df:
+            df[col] = df[col].astype('category')
     return df
 
 
+# The DataFrame helpers below work on a loaded frame and follow pandas
+# semantics: get_tunes_by_type and search_tunes treat the term as a regex
+# matched anywhere in the value. The menu uses the query_* functions instead,
+# which filter in SQLite: query_tunes_by_type matches a literal substring and
+# query_tunes_by_title matches word prefixes through the FTS index.
+
 def get_tunes_by_book(df: pd.DataFrame, book_number: int) -> pd.DataFrame:
     """Get all tunes from a specific book."""
     return df[df['book'] == book_number]
@@ -210,7 +423,15 @@ def get_tunes_by_book(df: pd.DataFrame, book_number: int) -> pd.DataFrame:
 
 def get_tunes_by_type(df: pd.DataFrame, tune_type: str) -> pd.DataFrame:
     """Get all tunes of a specific rhythm/type (case-insensitive)."""
-    mask = df['rhythm'].fillna('').str.lower().str.contains(tune_type.lower())
+    rhythm = df['rhythm']
+    if isinstance(rhythm.dtype, pd.CategoricalDtype):
+        # Match against the few distinct rhythms, then select rows by code
+        hits = rhythm.cat.categories.str.lower().str.contains(tune_type.lower())
+        codes = [code for code, hit in enumerate(hits) if hit]
+        if not tune_type:
+            codes.append(-1)  # missing rhythm (code -1) matches '' like fillna('')
+        return df[rhythm.cat.codes.isin(codes)]
+    mask = rhythm.fillna('').str.lower().str.contains(tune_type.lower())
     return df[mask]
 
 
@@ -221,18 +442,107 @@ def search_tunes(df: pd.DataFrame, search_term: str) -> pd.DataFrame:
 
 
 def top_composers(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
-    """Return top composers by count (non-null)."""
-    comp = df['composer'].fillna('Unknown')
-    return comp.value_counts().head(top_n).reset_index().rename(columns={'index': 'composer', 'composer': 'count'})
+    """Return top composers by count, labelling tunes without a composer 'Unknown'."""
+    counts = df['composer'].value_counts(dropna=False)
+    counts = counts[counts > 0]  # categoricals also count unused categories
+    # Label the missing-composer row on the small counts index, not the full column
+    counts.index = counts.index.astype(object).fillna('Unknown')
+    # Merge with a composer actually named 'Unknown', as query_top_composers does
+    counts = counts.groupby(level=0, sort=False).sum().sort_values(ascending=False, kind='stable')
+    return counts.rename_axis('composer').reset_index(name='count').head(top_n)
+
+
+# ---------------------------
+# SQL queries (filters pushed down to SQLite)
+# ---------------------------
+
+def _read_sql(db_path: str, sql: str, params: tuple = (), needs_fts: bool = False) -> pd.DataFrame:
+    conn = sqlite3.connect(db_path)
+    try:
+        if needs_fts:
+            ensure_fts(conn)
+        return pd.read_sql(sql, conn, params=params)
+    finally:
+        conn.close()
+
+
+def query_tunes_by_book(db_path: str, book_number: int) -> pd.DataFrame:
+    """Get all tunes from a specific book (uses idx_book)."""
+    return _read_sql(
+        db_path,
+        "SELECT id, title, rhythm, composer FROM tunes WHERE book = ? ORDER BY id",
+        (book_number,)
+    )
+
+
+def query_tunes_by_type(db_path: str, tune_type: str) -> pd.DataFrame:
+    """
+    Get all tunes whose rhythm/type contains tune_type as a literal substring
+    (Unicode case-insensitive). An empty type returns all tunes, including
+    those without a rhythm.
+    """
+    sql = "SELECT id, title, book, composer FROM tunes"
+    if not tune_type:
+        return _read_sql(db_path, sql + " ORDER BY id")
+    term = tune_type.lower()
+    conn = sqlite3.connect(db_path)
+    try:
+        # Rhythms have few distinct values: read them from idx_rhythm, match
+        # them with str.lower (SQLite's lower() only folds ASCII), then fetch
+        # the matching rows through the same index.
+        rhythms = [
+            rhythm for (rhythm,) in conn.execute("SELECT DISTINCT rhythm FROM tunes WHERE rhythm IS NOT NULL")
+            if term in rhythm.lower()
+        ]
+        return pd.read_sql(
+            sql + " WHERE rhythm IN (SELECT value FROM json_each(?)) ORDER BY id",
+            conn,
+            params=(json.dumps(rhythms),)
+        )
+    finally:
+        conn.close()
+
+
+def query_tunes_by_title(db_path: str, search_term: str) -> pd.DataFrame:
+    """
+    Search tunes by title via the tunes_fts full-text index.
+    Matches title words (case insensitive), the last word as a prefix,
+    e.g. 'drowsy mag' finds 'Drowsy Maggie'. An empty term returns all tunes.
+    The index is created on first use if the DB predates it.
+    """
+    sql = "SELECT id, title, book, rhythm, composer FROM tunes"
+    params = ()
+    if search_term.strip():
+        phrase = search_term.replace('"', '""')
+        sql += " WHERE id IN (SELECT rowid FROM tunes_fts WHERE tunes_fts MATCH ?)"
+        params = (f'title : "{phrase}"*',)
+    return _read_sql(db_path, sql + " ORDER BY id", params, needs_fts=bool(params))
+
+
+def query_top_composers(db_path: str, top_n: int = 10) -> pd.DataFrame:
+    """Return top composers by count, grouping missing composers as 'Unknown'."""
+    return _read_sql(
+        db_path,
+        """
+        SELECT COALESCE(composer, 'Unknown') AS composer, COUNT(*) AS count
+        FROM tunes
+        GROUP BY 1
+        ORDER BY count DESC
+        LIMIT ?
+        """,
+        (top_n,)
+    )
 
 
 # ---------------------------
 # Simple Command-Line Interface
 # ---------------------------
 
-def main_menu(db_path: str, base_dir: str):
+def main_menu(db_path: str, base_dir: str, max_workers: Optional[int] = None):
     """
     Simple interactive menu for the user.
+    Queries (3-6) run against SQLite directly and read only the columns they
+    print; option 2 reloads the DataFrame (without tune_text) each time.
     """
     while True:
         print("\nABC Parser & Analysis")
@@ -245,7 +555,7 @@ def main_menu(db_path: str, base_dir: str):
         print("7) Exit")
         choice = input("Enter choice: ").strip()
         if choice == '1':
-            n = import_abc_books(base_dir, db_path)
+            n = import_abc_books(base_dir, db_path, max_workers)
             print(f"Imported {n} tunes into {db_path}")
         elif choice == '2':
             df = load_tunes_df(db_path)
@@ -258,22 +568,18 @@ def main_menu(db_path: str, base_dir: str):
             except ValueError:
                 print("Invalid number")
                 continue
-            df = load_tunes_df(db_path)
-            res = get_tunes_by_book(df, bnum)
-            print(res[['id', 'title', 'rhythm', 'composer']].to_string(index=False))
+            res = query_tunes_by_book(db_path, bnum)
+            print(res.to_string(index=False))
         elif choice == '4':
             ttype = input("Enter rhythm/type (e.g., reel, jig, hornpipe): ").strip()
-            df = load_tunes_df(db_path)
-            res = get_tunes_by_type(df, ttype)
-            print(res[['id', 'title', 'book', 'composer']].to_string(index=False))
+            res = query_tunes_by_type(db_path, ttype)
+            print(res.to_string(index=False))
         elif choice == '5':
             term = input("Enter search term for title: ").strip()
-            df = load_tunes_df(db_path)
-            res = search_tunes(df, term)
-            print(res[['id', 'title', 'book', 'rhythm', 'composer']].to_string(index=False))
+            res = query_tunes_by_title(db_path, term)
+            print(res.to_string(index=False))
         elif choice == '6':
-            df = load_tunes_df(db_path)
-            print(top_composers(df, top_n=15).to_string(index=False))
+            print(query_top_composers(db_path, top_n=15).to_string(index=False))
         elif choice == '7':
             print("Goodbye.")
             break
@@ -291,5 +597,7 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="ABC Parser & Analysis")
     parser.add_argument('--base_dir', type=str, default='abc_books', help='Base directory containing abc_books/')
     parser.add_argument('--db', type=str, default='tunes.db', help='SQLite DB file path')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Parser processes for large imports (default: one per CPU; 1 disables the pool)')
     args = parser.parse_args()
-    main_menu(db_path=args.db, base_dir=args.base_dir)
+    main_menu(db_path=args.db, base_dir=args.base_dir, max_workers=args.workers)